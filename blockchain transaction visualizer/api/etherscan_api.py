@@ -1,25 +1,106 @@
-import requests
+import time
+from typing import Any, Dict, List, Union
+
+import httpx
+import msgspec
 
 ETHERSCAN_URL = "https://api.etherscan.io/api"
+PAGE_SIZE = 1000
+# Etherscan rejects page * offset beyond this, so once a window is used up
+# the startblock cursor is moved forward and paging starts again.
+MAX_WINDOW = 10000
+
+try:
+    import brotli  # noqa: F401  lets httpx decode br responses
+    _ENCODINGS = "gzip, deflate, br"
+except ImportError:
+    _ENCODINGS = "gzip, deflate"
+
+RETRIES = 3
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# one HTTP/2 client: paginated and repeated fetches share a single connection
+_CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(http2=True, retries=RETRIES, limits=httpx.Limits(max_keepalive_connections=8)),
+    timeout=30,
+    headers={"Accept-Encoding": _ENCODINGS},
+)
+
+
+def _get(params):
+    # transport retries cover connect errors; back off on throttling/5xx here
+    for attempt in range(RETRIES + 1):
+        r = _CLIENT.get(ETHERSCAN_URL, params=params)
+        if r.status_code not in RETRY_STATUSES or attempt == RETRIES:
+            break
+        time.sleep(0.3 * 2 ** attempt)
+    r.raise_for_status()
+    return r
+
+
+class EtherscanResponse(msgspec.Struct):
+    status: str
+    message: str
+    # list of transaction rows on success, an error string otherwise
+    result: Union[List[Dict[str, Any]], str]
+
 
-def fetch_transactions_from_etherscan(address, apikey):
+def _fetch_page(params):
+    r = _get(params)
+    data = msgspec.json.decode(r.content, type=EtherscanResponse)
+
+    if data.status == "0" and data.message == "No transactions found":
+        return []
+
+    if data.message == "OK" and isinstance(data.result, list):
+        return data.result
+
+    raise Exception(f"Etherscan Error: {msgspec.structs.asdict(data)}")
+
+
+def fetch_transactions_from_etherscan(address, apikey, startblock=0, endblock=99999999):
     params = {
         "module": "account",
         "action": "txlist",
         "address": address,
-        "startblock": 0,
-        "endblock": 99999999,
+        "startblock": startblock,
+        "endblock": endblock,
         "sort": "asc",
+        "offset": PAGE_SIZE,
         "apikey": apikey
     }
 
-    r = requests.get(ETHERSCAN_URL, params=params, timeout=30)
-    data = r.json()
+    page = 1
+    seen = set()
+    last_block = None
+    block_hashes = set()
+    while True:
+        params["page"] = page
+        count = 0
 
-    if data.get("status") == "0" and data.get("message") == "No transactions found":
-        return []
+        for tx in _fetch_page(params):
+            count += 1
+            block = tx.get("blockNumber")
+            if block != last_block:
+                last_block = block
+                block_hashes = set()
+            block_hashes.add(tx.get("hash"))
+            if tx.get("hash") in seen:
+                continue
+            yield tx
+
+        if count < PAGE_SIZE:
+            return
 
-    if data.get("message") == "OK":
-        return data["result"]
+        if page * PAGE_SIZE < MAX_WINDOW:
+            page += 1
+            continue
 
-    raise Exception(f"Etherscan Error: {data}")
+        # window exhausted: restart from the last block, skipping the rows
+        # of that block that were already yielded
+        if int(last_block) == int(params["startblock"]):
+            raise Exception(f"Etherscan Error: more than {MAX_WINDOW} transactions in block {last_block}")
+        params["startblock"] = int(last_block)
+        # copy: block_hashes keeps collecting the re-read rows of this block
+        seen = set(block_hashes)
+        page = 1
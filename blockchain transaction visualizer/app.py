@@ -1,17 +1,72 @@
+import hashlib
+import io
 import os
 import time
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from api.etherscan_api import fetch_transactions_from_etherscan
 from graph.graph_builder import build_graph_from_txlist
-from graph.graph_visualizer import pyvis_from_networkx
-from utils.helpers import wei_to_eth
+from graph.graph_visualizer import pyvis_from_networkx, network_html
+from utils.helpers import wei_to_eth_array, normalize_addresses, load_cached_txs, save_cached_txs
 
 st.set_page_config(page_title="Blockchain Transaction Visualizer", layout="wide")
 st.title("🔗 Blockchain Transaction Visualizer (Ethereum)")
 
 
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def _cached_fetch(address, api_key):
+    df = load_cached_txs(address)
+    if df is None:
+        df = pd.DataFrame(list(fetch_transactions_from_etherscan(address, api_key)))
+        save_cached_txs(address, df)
+    return df.to_dict(orient="records")
+
+
+def _txs_key(txlist):
+    # str() every value: a raw NaN (blank CSV cell) hashes by identity
+    h = hashlib.sha1()
+    for t in txlist:
+        h.update("|".join(str(t.get(c, "")) for c in ("hash", "from", "to", "value")).encode())
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def _store_txs(txlist, txs_hash=None, csv_id=None):
+    # called once per load (not per rerun), so the key is computed only then
+    st.session_state["txs"] = txlist
+    st.session_state["txs_hash"] = txs_hash or _txs_key(txlist)
+    st.session_state["csv_id"] = csv_id
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _read_csv(data):
+    return pd.read_csv(io.BytesIO(data)).to_dict(orient="records")
+
+
+# Each stage below is cached on its own inputs (underscored arguments are not
+# hashed by streamlit; the explicit keys stand in for them), so a filter change
+# only reruns the stages downstream of it.
+@st.cache_data(max_entries=8, show_spinner=False)
+def _to_dataframe(txs_hash, _txlist):
+    df = normalize_addresses(pd.DataFrame(_txlist))
+    df["value_eth"] = wei_to_eth_array(df["value"])
+    return df
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_graph_cached(txs_hash, _df, min_value, focus_addr, max_nodes):
+    df = _df.loc[_df["value_eth"].to_numpy() >= min_value]
+    return df, build_graph_from_txlist(df, focus_addr, max_nodes)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _render_graph_html(graph_key, _G, focus_addr, physics):
+    net = pyvis_from_networkx(_G, focus_node=focus_addr, physics=physics)
+    return network_html(net)
+
+
 # ----------------------------------
 # Sidebar Input
 # ----------------------------------
@@ -46,15 +101,16 @@ txlist = None
 if mode == "Etherscan API" and 'fetch_btn' in locals() and fetch_btn:
     with st.spinner("Fetching transactions..."):
         try:
-            txlist = fetch_transactions_from_etherscan(address, api_key)
-            st.session_state["txs"] = txlist
+            txlist = _cached_fetch(address, api_key)
+            _store_txs(txlist)
         except Exception as e:
             st.error(f"Fetch failed: {e}")
 
 elif mode == "Upload CSV" and uploaded:
-    df = pd.read_csv(uploaded)
-    txlist = df.to_dict(orient="records")
-    st.session_state["txs"] = txlist
+    if st.session_state.get("csv_id") != uploaded.file_id:
+        data = uploaded.getvalue()
+        _store_txs(_read_csv(data), txs_hash=hashlib.sha1(data).hexdigest(), csv_id=uploaded.file_id)
+    txlist = st.session_state["txs"]
 
 elif mode == "Sample Data" and 'sample_btn' in locals() and sample_btn:
     sample = [
@@ -62,7 +118,7 @@ elif mode == "Sample Data" and 'sample_btn' in locals() and sample_btn:
         {"hash": "0x2", "from": "0xBBB", "to": "0xCCC", "value": str(int(0.3 * 1e18)), "timeStamp": str(int(time.time()))},
     ]
     txlist = sample
-    st.session_state["txs"] = sample
+    _store_txs(sample)
 
 
 # ----------------------------------
@@ -74,28 +130,28 @@ if "txs" in st.session_state:
     txlist = st.session_state["txs"]
 
 if txlist:
-    df = pd.DataFrame(txlist)
-    df["value_eth"] = df["value"].apply(lambda v: wei_to_eth(str(v)))
-    df = df[df["value_eth"] >= min_value]
+    txs_hash = st.session_state["txs_hash"]
+    all_df = _to_dataframe(txs_hash, txlist)
 
-    st.dataframe(df.head(200))
+    # Build graph (filter + aggregation, cached per filter settings)
+    df, G = _build_graph_cached(txs_hash, all_df, min_value, focus_addr, max_nodes)
+    graph_key = (txs_hash, min_value, focus_addr, max_nodes)
 
-    # Build graph
-    G = build_graph_from_txlist(df.to_dict(orient="records"), focus_addr, max_nodes)
+    st.dataframe(df.head(200))
 
     # Stats
     st.write(f"Graph Nodes: {G.number_of_nodes()}, Edges: {G.number_of_edges()}")
 
-    total_value = sum([d.get("total_value", 0) for _, _, d in G.edges(data=True)])
+    total_value = float(np.fromiter(
+        (d.get("total_value", 0.0) for _, _, d in G.edges(data=True)),
+        dtype=np.float64, count=G.number_of_edges()
+    ).sum())
     st.metric("Total ETH Moved", f"{total_value:.5f} ETH")
 
     # Visualize graph
     st.subheader("Network Graph")
-    net = pyvis_from_networkx(G, focus_node=focus_addr, physics=physics)
-    net.save_graph("network.html")
-
-    with open("network.html", "r", encoding="utf-8") as f:
-        st.components.v1.html(f.read(), height=750)
+    html = _render_graph_html(graph_key, G, focus_addr, physics)
+    st.components.v1.html(html, height=750)
 
 else:
     st.info("Load data from the left panel.")
@@ -0,0 +1 @@
+# lets the tests import the app packages (api, graph, utils) the way app.py does
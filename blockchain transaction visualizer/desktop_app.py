@@ -4,6 +4,9 @@ Blockchain Transaction Visualizer - Desktop UI (Tkinter)
 Save this file as `desktop_app.py` and run:
     python desktop_app.py
 
+Run it from this directory: the Etherscan client, the cache helpers and the
+graph builder are shared with app.py (api/, utils/, graph/).
+
 Features:
 - Enter Ethereum address + Etherscan API key (or load CSV)
 - Fetch transactions via Etherscan or load CSV file
@@ -12,89 +15,87 @@ Features:
 - Preview transactions in a table and export nodes/edges CSV
 
 Dependencies:
-- requests
+- httpx[http2]
+- msgspec
+- numpy
 - pandas
+- scipy
+- pyarrow (optional, on-disk fetch cache)
 - networkx
 - matplotlib
+- python-igraph (optional, faster layouts)
+- datashader (optional, renders graphs above 500 nodes)
 
-Install: pip install requests pandas networkx matplotlib
+Install: pip install "httpx[http2]" msgspec numpy pandas scipy networkx matplotlib
 
 """
 
 import os
 import io
-import math
 import time
 import csv
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import numpy as np
 import pandas as pd
 import networkx as nx
 import matplotlib
-matplotlib.use('Agg')  # use non-interactive backend for drawing then display as image
+matplotlib.use('TkAgg')
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-
-ETHERSCAN_URL = "https://api.etherscan.io/api"
+try:
+    import igraph as ig  # optional, much faster layouts for large graphs
+except ImportError:
+    ig = None
+try:
+    import datashader as ds  # optional, rasterized rendering of large graphs
+    import datashader.transfer_functions as tf
+    from datashader.bundling import connect_edges
+except ImportError:
+    ds = None
+
+from api.etherscan_api import fetch_transactions_from_etherscan
+from graph.graph_builder import build_graph_from_txlist
+from utils.helpers import CACHE_TTL, wei_to_eth_array, normalize_addresses, load_cached_txs, save_cached_txs
+
+_fetch_cache = {}  # (address, startblock, endblock) -> (DataFrame, expiry)
+_fetch_cache_lock = threading.Lock()  # fetches run on the worker pool
+FETCH_CACHE_SIZE = 64  # same bound as the Streamlit fetch cache
+TABLE_PAGE_SIZE = 500  # rows inserted into the transactions table per page
+TABLE_COLUMNS = ('hash', 'from', 'to', 'value_eth', 'timeStamp')
+LAYOUT_CACHE_SIZE = 16
+IGRAPH_MIN_NODES = 200  # above this use igraph's C layout when available
+LARGE_GRAPH_NODES = 500  # above this skip per-artist matplotlib drawing
 
 # -------------------- Helpers --------------------
 
-def wei_to_eth(value):
-    try:
-        return int(value) / 1e18
-    except Exception:
-        try:
-            return float(value) / 1e18
-        except Exception:
-            return 0.0
-
-
-def fetch_transactions_from_etherscan(address, apikey, startblock=0, endblock=99999999, sort='asc'):
-    params = {
-        'module': 'account',
-        'action': 'txlist',
-        'address': address,
-        'startblock': startblock,
-        'endblock': endblock,
-        'sort': sort,
-        'apikey': apikey,
-    }
-    resp = requests.get(ETHERSCAN_URL, params=params, timeout=30)
-    resp.raise_for_status()
-    data = resp.json()
-    if data.get('status') == '0' and data.get('message') == 'No transactions found':
-        return []
-    if data.get('message') == 'OK':
-        return data.get('result', [])
-    raise Exception(f"Etherscan error: {data}")
-
-
-# build graph
-def build_graph_from_txlist(txlist, min_value_eth=0.0):
-    G = nx.DiGraph()
-    for tx in txlist:
-        frm = tx.get('from')
-        to = tx.get('to')
-        value = wei_to_eth(tx.get('value', 0))
-        if not frm or not to:
-            continue
-        if value < min_value_eth:
-            continue
-        if not G.has_node(frm):
-            G.add_node(frm, total_in=0.0, total_out=0.0, tx_in=0, tx_out=0)
-        if not G.has_node(to):
-            G.add_node(to, total_in=0.0, total_out=0.0, tx_in=0, tx_out=0)
-        G.nodes[frm]['total_out'] += value
-        G.nodes[frm]['tx_out'] += 1
-        G.nodes[to]['total_in'] += value
-        G.nodes[to]['tx_in'] += 1
-        if G.has_edge(frm, to):
-            G[frm][to]['total_value'] += value
-            G[frm][to]['tx_count'] += 1
-        else:
-            G.add_edge(frm, to, total_value=value, tx_count=1)
-    return G
+def fetch_transactions_cached(address, apikey, startblock=0, endblock=99999999):
+    """Return the transactions of `address` as a DataFrame, served from memory
+    or ~/.cache/btv while younger than CACHE_TTL seconds."""
+    key = (address.lower(), startblock, endblock)
+    with _fetch_cache_lock:
+        hit = _fetch_cache.get(key)
+    if hit is not None and hit[1] > time.monotonic():
+        return hit[0]
+    # the disk cache holds full histories only
+    full_range = (startblock, endblock) == (0, 99999999)
+    df = load_cached_txs(address) if full_range else None
+    if df is None:
+        df = pd.DataFrame(list(fetch_transactions_from_etherscan(address, apikey, startblock, endblock)))
+        if full_range:
+            save_cached_txs(address, df)
+    now = time.monotonic()
+    with _fetch_cache_lock:
+        # drop expired entries, then the oldest ones, to stay under the bound
+        for k in [k for k, (_, expiry) in _fetch_cache.items() if expiry <= now]:
+            del _fetch_cache[k]
+        _fetch_cache.pop(key, None)
+        while len(_fetch_cache) >= FETCH_CACHE_SIZE:
+            _fetch_cache.pop(next(iter(_fetch_cache)), None)
+        _fetch_cache[key] = (df, now + CACHE_TTL)
+    return df
 
 
 # -------------------- UI App --------------------
@@ -105,6 +106,15 @@ class App:
         self.root.geometry('1100x700')
         self.tx_df = None
         self.graph = None
+        self.table_rows = 0
+        self._layout_cache = {}
+        self._layout_lock = threading.Lock()  # the cache is filled from pool threads
+        self._artists = None  # matplotlib artists of the last drawn graph
+        self.pool = ThreadPoolExecutor(max_workers=4)
+        self._draw_cancel = None
+        self._bg = None  # canvas background for blitting the highlight
+        self._closed = False
+        root.protocol('WM_DELETE_WINDOW', self.on_close)
 
         # Top frame for inputs
         top = ttk.Frame(root)
@@ -136,10 +146,15 @@ class App:
         ttk.Label(ctrl, text='Highlight address:').pack(side=tk.LEFT, padx=(10,0))
         self.highlight_entry = ttk.Entry(ctrl, width=44)
         self.highlight_entry.pack(side=tk.LEFT, padx=6)
+        self.highlight_entry.bind('<Return>', self.on_highlight)
 
         self.draw_btn = ttk.Button(ctrl, text='Build & Draw Graph', command=self.on_draw)
         self.draw_btn.pack(side=tk.LEFT, padx=6)
 
+        self.cancel_btn = ttk.Button(ctrl, text='Cancel', command=self.on_cancel)
+        self.cancel_btn.pack(side=tk.LEFT, padx=6)
+        self.cancel_btn.state(['disabled'])
+
         self.export_btn = ttk.Button(ctrl, text='Export Nodes/Edges', command=self.on_export)
         self.export_btn.pack(side=tk.LEFT, padx=6)
 
@@ -154,6 +169,7 @@ class App:
         self.ax = self.fig.add_subplot(111)
         self.canvas = FigureCanvasTkAgg(self.fig, master=left_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
 
         # Right: Transactions table and stats
         right_frame = ttk.Frame(paned, width=380)
@@ -163,9 +179,12 @@ class App:
         stats_frame.pack(fill=tk.X, pady=(0,6))
         self.stat_label = ttk.Label(stats_frame, text='Transactions: 0 | Nodes: 0 | Edges: 0')
         self.stat_label.pack(side=tk.LEFT, padx=6)
+        self.more_btn = ttk.Button(stats_frame, text='Load more', command=self.on_load_more)
+        self.more_btn.pack(side=tk.RIGHT, padx=6)
+        self.more_btn.state(['disabled'])
 
         # Treeview for transactions
-        cols = ('hash', 'from', 'to', 'value_eth', 'timeStamp')
+        cols = TABLE_COLUMNS
         self.tree = ttk.Treeview(right_frame, columns=cols, show='headings', height=25)
         for c in cols:
             self.tree.heading(c, text=c)
@@ -184,24 +203,34 @@ class App:
         if not api:
             if not messagebox.askyesno('No API key', 'No Etherscan API key provided. Continue and hope rate limit allows?'):
                 return
+        self.root.config(cursor='wait')
+        self.fetch_btn.state(['disabled'])
+        # network I/O runs on the pool; the result is handed back to the Tk thread
+        fut = self.pool.submit(self._fetch_worker, address, api)
+        fut.add_done_callback(lambda f: self._post(self._on_fetch_done, f))
+
+    def _fetch_worker(self, address, api):
+        df = fetch_transactions_cached(address, api).copy()
+        if not df.empty:
+            normalize_addresses(df)
+            df['value_eth'] = wei_to_eth_array(df['value'])
+        return df
+
+    def _on_fetch_done(self, fut):
+        self.root.config(cursor='')
+        self.fetch_btn.state(['!disabled'])
         try:
-            self.root.config(cursor='wait')
-            self.root.update()
-            txs = fetch_transactions_from_etherscan(address, api)
-            # normalize into DataFrame
-            df = pd.DataFrame(txs)
-            if df.empty:
-                messagebox.showinfo('No tx', 'No transactions found for this address')
-                self.tx_df = None
-                return
-            df['value_eth'] = df['value'].apply(lambda v: wei_to_eth(str(v)))
-            self.tx_df = df
-            self.populate_table()
-            messagebox.showinfo('Done', f'Fetched {len(df)} transactions')
+            df = fut.result()
         except Exception as e:
             messagebox.showerror('Error', str(e))
-        finally:
-            self.root.config(cursor='')
+            return
+        if df.empty:
+            messagebox.showinfo('No tx', 'No transactions found for this address')
+            self.tx_df = None
+            return
+        self.tx_df = df
+        self.populate_table()
+        messagebox.showinfo('Done', f'Fetched {len(df)} transactions')
 
     def on_load_csv(self):
         path = filedialog.askopenfilename(filetypes=[('CSV files','*.csv'),('All files','*.*')])
@@ -215,7 +244,8 @@ class App:
             if 'value' not in df.columns:
                 messagebox.showerror('CSV error', 'CSV must contain a "value" column (in Wei)')
                 return
-            df['value_eth'] = df['value'].apply(lambda v: wei_to_eth(str(v)))
+            normalize_addresses(df)
+            df['value_eth'] = wei_to_eth_array(df['value'])
             self.tx_df = df
             self.populate_table()
             messagebox.showinfo('Loaded', f'Loaded CSV with {len(df)} rows')
@@ -223,79 +253,251 @@ class App:
             messagebox.showerror('Error', str(e))
 
     def populate_table(self):
-        for r in self.tree.get_children():
-            self.tree.delete(r)
+        self.tree.delete(*self.tree.get_children())
+        self.table_rows = 0
         if self.tx_df is None:
+            self.more_btn.state(['disabled'])
             self.stat_label.config(text='Transactions: 0 | Nodes: 0 | Edges: 0')
             return
-        for _, row in self.tx_df.iterrows():
-            h = row.get('hash', '')
-            frm = row.get('from', '')
-            to = row.get('to', '')
-            v = row.get('value_eth', 0.0)
-            ts = row.get('timeStamp', '')
-            self.tree.insert('', tk.END, values=(h, frm, to, f"{v:.6f}", ts))
+        self.insert_rows(TABLE_PAGE_SIZE)
         self.stat_label.config(text=f'Transactions: {len(self.tx_df)} | Nodes: 0 | Edges: 0')
 
+    def insert_rows(self, count):
+        # only a page of rows lives in the tree; 'Load more' appends the next one
+        df = self.tx_df.iloc[self.table_rows:self.table_rows + count]
+        # format the value column in one pass; missing columns show as empty
+        page = df.reindex(columns=list(TABLE_COLUMNS), fill_value='')
+        page['value_eth'] = np.char.mod('%.6f', df['value_eth'].to_numpy(dtype=np.float64))
+        # hide columns and unpack the tree so Tk does not relayout per insert
+        self.tree.configure(displaycolumns=())
+        self.tree.pack_forget()
+        try:
+            for values in page.itertuples(index=False, name=None):
+                self.tree.insert('', tk.END, values=values)
+        finally:
+            self.tree.configure(displaycolumns='#all')
+            self.tree.pack(fill=tk.BOTH, expand=True)
+        self.table_rows += len(df)
+        if self.table_rows < len(self.tx_df):
+            self.more_btn.state(['!disabled'])
+        else:
+            self.more_btn.state(['disabled'])
+
+    def on_load_more(self):
+        if self.tx_df is not None:
+            self.insert_rows(TABLE_PAGE_SIZE)
+
     def on_draw(self):
         if self.tx_df is None:
             messagebox.showwarning('No data', 'No transactions loaded. Use Fetch or Load CSV.')
             return
         min_v = float(self.min_value_var.get() or 0.0)
-        df = self.tx_df.copy()
-        df = df[df['value_eth'] >= min_v]
-        txlist = df.to_dict(orient='records')
-        G = build_graph_from_txlist(txlist, min_value_eth=min_v)
+        cancel = threading.Event()
+        self._draw_cancel = cancel
+        self.root.config(cursor='wait')
+        self.draw_btn.state(['disabled'])
+        self.cancel_btn.state(['!disabled'])
+        fut = self.pool.submit(self._build_worker, self.tx_df, min_v, cancel)
+        fut.add_done_callback(lambda f: self._post(self._on_draw_done, f, cancel))
+
+    def _build_worker(self, tx_df, min_v, cancel):
+        # graph build and layout off the Tk thread; bail out between phases on cancel
+        n_tx = int((tx_df['value_eth'].to_numpy() >= min_v).sum())
+        G = build_graph_from_txlist(tx_df, min_value_eth=min_v)
+        if cancel.is_set():
+            return None
+        if G.number_of_nodes():
+            self.compute_layout(self.display_graph(G))  # warms the layout cache used by draw_network
+        if cancel.is_set():
+            return None
+        return n_tx, G
+
+    def _on_draw_done(self, fut, cancel):
+        if cancel is not self._draw_cancel:
+            return  # superseded by a newer draw
+        self.root.config(cursor='')
+        self.draw_btn.state(['!disabled'])
+        self.cancel_btn.state(['disabled'])
+        try:
+            result = fut.result()
+        except Exception as e:
+            messagebox.showerror('Error', str(e))
+            return
+        if result is None:
+            return
+        n_tx, G = result
         self.graph = G
         # update stats
-        self.stat_label.config(text=f'Transactions: {len(df)} | Nodes: {G.number_of_nodes()} | Edges: {G.number_of_edges()}')
+        self.stat_label.config(text=f'Transactions: {n_tx} | Nodes: {G.number_of_nodes()} | Edges: {G.number_of_edges()}')
         # draw graph with matplotlib
         self.draw_network(G)
 
+    def _post(self, fn, *args):
+        # hand a pool result back to the Tk thread, unless the window is gone
+        if self._closed:
+            return
+        try:
+            self.root.after(0, fn, *args)
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def on_close(self):
+        self._closed = True
+        if self._draw_cancel is not None:
+            self._draw_cancel.set()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+    def on_cancel(self):
+        if self._draw_cancel is not None:
+            self._draw_cancel.set()
+        self.root.config(cursor='')
+        self.draw_btn.state(['!disabled'])
+        self.cancel_btn.state(['disabled'])
+
+    def compute_layout(self, G):
+        # positions only depend on topology (isolated nodes included), so reuse them across redraws
+        key = (frozenset(G.nodes()), frozenset(G.edges()))
+        with self._layout_lock:
+            pos = self._layout_cache.get(key)
+        if pos is not None:
+            return key, pos
+        if ig is not None and G.number_of_nodes() > IGRAPH_MIN_NODES:
+            g = ig.Graph.TupleList(G.edges(), directed=True)
+            coords = g.layout_fruchterman_reingold(niter=50)
+            pos = dict(zip(g.vs['name'], coords.coords))
+            for n in G.nodes():
+                pos.setdefault(n, (0.0, 0.0))
+        else:
+            try:
+                pos = nx.spring_layout(G, k=0.5, iterations=50)
+            except Exception:
+                pos = nx.spring_layout(G)
+        with self._layout_lock:
+            while len(self._layout_cache) >= LAYOUT_CACHE_SIZE:
+                self._layout_cache.pop(next(iter(self._layout_cache)), None)
+            self._layout_cache[key] = pos
+        return key, pos
+
     def draw_network(self, G):
-        self.ax.clear()
         if G.number_of_nodes() == 0:
+            self.ax.clear()
+            self._artists = None
+            self._bg = None
             self.ax.text(0.5,0.5,'No nodes to display', ha='center')
             self.canvas.draw()
             return
-        # compute positions
+        shown = self.display_graph(G)
+        key, pos = self.compute_layout(shown)
+        if shown.number_of_nodes() > LARGE_GRAPH_NODES:
+            self.draw_rasterized(shown, pos)
+            return
+        note = None
+        if shown is not G:
+            note = f'Graph too large: showing top {shown.number_of_nodes()} of {G.number_of_nodes()} nodes by volume'
+        G = shown
+        # node sizes by total volume, edge widths by value (one numpy pass each)
+        vols = np.fromiter((d.get('total_in',0) + d.get('total_out',0) for _,d in G.nodes(data=True)),
+                           dtype=np.float64, count=G.number_of_nodes())
+        sizes = 50.0 + 400.0 * vols / (vols.max() or 1.0)
+        vals = np.fromiter((d.get('total_value',0) for _,_,d in G.edges(data=True)),
+                           dtype=np.float64, count=G.number_of_edges())
+        edge_widths = (1.0 + np.log1p(vals + 1.0) * 2.0).tolist()
+        if self._artists is not None and self._artists['key'] == key:
+            # same topology: update the existing artists in place. The new graph
+            # may list nodes/edges in another order, so map values back onto the
+            # order the artists were drawn in.
+            size_of = dict(zip(G.nodes(), sizes))
+            width_of = dict(zip(G.edges(), edge_widths))
+            self._artists['nodes'].set_sizes([size_of[n] for n in self._artists['node_order']])
+            for patch, e in zip(self._artists['edges'], self._artists['edge_order']):
+                patch.set_linewidth(width_of[e])
+        else:
+            self.ax.clear()
+            labels = {n: (n[:8] + '...') for n in G.nodes()}
+            nodes = nx.draw_networkx_nodes(G, pos, node_size=sizes, ax=self.ax)
+            nx.draw_networkx_labels(G, pos, labels=labels, font_size=8, ax=self.ax)
+            edges = nx.draw_networkx_edges(G, pos, width=edge_widths, arrows=True, ax=self.ax, arrowstyle='->', arrowsize=10)
+            # animated: left out of the full render and blitted on top of it
+            highlight = self.ax.scatter([], [], s=600, c='gold', zorder=3, animated=True)
+            self._artists = {'key': key, 'pos': pos, 'nodes': nodes, 'edges': edges, 'highlight': highlight,
+                             'node_order': list(G.nodes()), 'edge_order': list(G.edges())}
+            if note:
+                self.ax.set_title(note, fontsize=9)
+            self.ax.set_axis_off()
+            self.fig.tight_layout()
+        self._set_highlight()
         try:
-            pos = nx.spring_layout(G, k=0.5, iterations=50)
-        except Exception:
-            pos = nx.spring_layout(G)
-        # compute node sizes by total volume
-        vols = []
-        for n,d in G.nodes(data=True):
-            vol = d.get('total_in',0) + d.get('total_out',0)
-            vols.append(vol)
-        maxv = max(vols) if vols else 1.0
-        sizes = [50 + (400 * (v / maxv)) for v in vols]
-        labels = {n: (n[:8] + '...') for n in G.nodes()}
-        # draw nodes
-        nx.draw_networkx_nodes(G, pos, node_size=sizes, ax=self.ax)
-        nx.draw_networkx_labels(G, pos, labels=labels, font_size=8, ax=self.ax)
-        # draw edges with width scaled
-        edge_widths = []
-        for u,v,d in G.edges(data=True):
-            val = d.get('total_value',0)
-            edge_widths.append(1 + math.log1p(val+1)*2)
-        nx.draw_networkx_edges(G, pos, width=edge_widths, arrows=True, ax=self.ax, arrowstyle='->', arrowsize=10)
-        # highlight node if requested
-        highlight = self.highlight_entry.get().strip()
-        if highlight:
-            if G.has_node(highlight):
-                nx.draw_networkx_nodes(G, pos, nodelist=[highlight], node_color='gold', node_size=600, ax=self.ax)
+            self.canvas.draw()
+        except Exception as e:
+            messagebox.showerror('Draw error', str(e))
+
+    def display_graph(self, G):
+        # matplotlib draws one artist per node/edge, which does not scale past a
+        # few hundred nodes: large graphs are rasterized with datashader when it
+        # is installed, otherwise cut down to the top nodes by volume
+        if G.number_of_nodes() <= LARGE_GRAPH_NODES or ds is not None:
+            return G
+        nodes = list(G.nodes())
+        vols = np.fromiter((d.get('total_in',0) + d.get('total_out',0) for _,d in G.nodes(data=True)),
+                           dtype=np.float64, count=len(nodes))
+        top = np.argpartition(-vols, LARGE_GRAPH_NODES - 1)[:LARGE_GRAPH_NODES]
+        return G.subgraph([nodes[i] for i in top])
+
+    def draw_rasterized(self, G, pos):
+        # aggregate edges into an image; cost scales with pixels, not edges
+        nodes = list(G.nodes())
+        index = {n: i for i, n in enumerate(nodes)}
+        xy = np.array([pos[n] for n in nodes], dtype=np.float64)
+        nodes_df = pd.DataFrame({'x': xy[:, 0], 'y': xy[:, 1]})
+        edges_df = pd.DataFrame({'source': [index[u] for u, _ in G.edges()],
+                                 'target': [index[v] for _, v in G.edges()]})
+        pad = 0.05 * max(np.ptp(xy[:, 0]), np.ptp(xy[:, 1]), 1e-9)
+        x_range = (xy[:, 0].min() - pad, xy[:, 0].max() + pad)
+        y_range = (xy[:, 1].min() - pad, xy[:, 1].max() + pad)
+        cvs = ds.Canvas(plot_width=800, plot_height=600, x_range=x_range, y_range=y_range)
+        edge_img = tf.shade(cvs.line(connect_edges(nodes_df, edges_df), 'x', 'y', agg=ds.count()), how='log')
+        node_img = tf.spread(tf.shade(cvs.points(nodes_df, 'x', 'y', agg=ds.count()), cmap=['#1f78b4']), px=2)
+        img = tf.stack(edge_img, node_img)
+        self.ax.clear()
+        self.ax.imshow(np.asarray(img.to_pil()), extent=(*x_range, *y_range), aspect='auto')
+        self.ax.set_title(f'{len(nodes)} nodes / {G.number_of_edges()} edges (rasterized)', fontsize=9)
         self.ax.set_axis_off()
+        highlight = self.ax.scatter([], [], s=600, c='gold', zorder=3, animated=True)
+        # key None: the next draw always rebuilds the axes
+        self._artists = {'key': None, 'pos': pos, 'nodes': None, 'edges': [], 'highlight': highlight}
+        self._set_highlight()
         self.fig.tight_layout()
-        # render to canvas
-        # To show in Tkinter we need to use FigureCanvasTkAgg with interactive backend: switch temporarily
         try:
-            # Use AGG to draw then show via FigureCanvasTkAgg
-            self.canvas.figure = self.fig
             self.canvas.draw()
         except Exception as e:
             messagebox.showerror('Draw error', str(e))
 
+    def _set_highlight(self):
+        # highlight node if requested
+        highlight = self.highlight_entry.get().strip().lower()
+        marker = self._artists['highlight']
+        if highlight and highlight in self._artists['pos']:
+            marker.set_offsets([self._artists['pos'][highlight]])
+            marker.set_visible(True)
+        else:
+            marker.set_visible(False)
+
+    def _on_canvas_draw(self, event):
+        # every full render (draw, resize) refreshes the cached background
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        if self._artists is not None:
+            self.ax.draw_artist(self._artists['highlight'])
+
+    def on_highlight(self, event=None):
+        if self.graph is None or self._artists is None or self._bg is None:
+            return
+        # repaint only the highlight marker over the cached background
+        self._set_highlight()
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self._artists['highlight'])
+        self.canvas.blit(self.ax.bbox)
+
     def on_export(self):
         if self.graph is None:
             messagebox.showwarning('No graph', 'Build the graph first')
@@ -1,41 +1,92 @@
 import networkx as nx
-from utils.helpers import wei_to_eth
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from utils.helpers import wei_to_eth_array
 
 
-def build_graph_from_txlist(txlist, focus_addr=None, max_nodes=300):
-    G = nx.DiGraph()
+def _tx_columns(txs):
+    if isinstance(txs, tuple):
+        frm, to, value_eth = txs
+        return pd.Series(frm), pd.Series(to), np.asarray(value_eth, dtype=np.float64)
+
+    df = txs if isinstance(txs, pd.DataFrame) else pd.DataFrame(txs)
+    missing = pd.Series(None, index=df.index, dtype=object)
+    if "value_eth" in df.columns:
+        value_eth = df["value_eth"].to_numpy(dtype=np.float64)
+    else:
+        value_eth = wei_to_eth_array(df.get("value", missing))
+    return df.get("from", missing), df.get("to", missing), value_eth
+
+
+def build_graph_from_txlist(txs, focus_addr=None, max_nodes=300, min_value_eth=0.0):
+    """Build the transfer graph from a transactions DataFrame (``from``, ``to``
+    and ``value_eth`` or wei ``value``) or a ``(from, to, value_eth)`` tuple of arrays.
+
+    Transactions below ``min_value_eth`` are left out. Nodes carry ETH totals and
+    transaction counts (``tx_in``/``tx_out``), edges ``total_value`` and ``tx_count``."""
+    frm, to, amt = _tx_columns(txs)
+    valid = (frm.notna() & to.notna() & (frm != "") & (to != "")).to_numpy(dtype=bool, na_value=False)
+    if min_value_eth:
+        valid = valid & (amt >= min_value_eth)
+    if not valid.any():
+        return nx.DiGraph()
+    frm, to, amt = frm.to_numpy()[valid], to.to_numpy()[valid], amt[valid]
+
+    # integer ids shared by both address columns
+    n_tx = len(frm)
+    ids, addrs = pd.factorize(np.concatenate([frm, to]))
+    src, dst = ids[:n_tx], ids[n_tx:]
+    n = len(addrs)
 
-    for tx in txlist:
-        frm = tx.get("from")
-        to = tx.get("to")
-        amt = wei_to_eth(tx.get("value", "0"))
-
-        if not frm or not to:
-            continue
-
-        # ensure nodes
-        if not G.has_node(frm):
-            G.add_node(frm, total_in=0, total_out=0)
-        if not G.has_node(to):
-            G.add_node(to, total_in=0, total_out=0)
-
-        # update values
-        G.nodes[frm]["total_out"] += amt
-        G.nodes[to]["total_in"] += amt
-
-        # edges
-        if G.has_edge(frm, to):
-            G[frm][to]["total_value"] += amt
-        else:
-            G.add_edge(frm, to, total_value=amt)
-
-    # trim nodes if too large
-    if G.number_of_nodes() > max_nodes and focus_addr:
-        focus = focus_addr.lower()
-        if G.has_node(focus):
-            neighbors = list(G.predecessors(focus)) + list(G.successors(focus))
-            neighbors = neighbors[: max_nodes - 1]
-            keep = {focus} | set(neighbors)
-            return G.subgraph(keep).copy()
+    # node totals over every transaction, including those trimmed below
+    total_out = np.bincount(src, weights=amt, minlength=n)
+    total_in = np.bincount(dst, weights=amt, minlength=n)
+    tx_out = np.bincount(src, minlength=n)
+    tx_in = np.bincount(dst, minlength=n)
 
+    # trim nodes if too large: decide what to keep on the flat arrays so only
+    # the kept transactions are aggregated and inserted
+    if n > max_nodes and focus_addr:
+        hit = np.flatnonzero(addrs == focus_addr.lower())
+        if hit.size:
+            focus = hit[0]
+            rows = (src == focus) | (dst == focus)
+            other = np.where(src[rows] == focus, dst[rows], src[rows])
+            volume = np.bincount(other, weights=amt[rows], minlength=n)
+            neighbors = np.unique(other)
+            neighbors = neighbors[neighbors != focus]
+            k = max_nodes - 1
+            if len(neighbors) > k:
+                # top-k neighbors by ETH exchanged with the focus address
+                neighbors = neighbors[np.argpartition(-volume[neighbors], k - 1)[:k]] if k > 0 else neighbors[:0]
+            keep = np.concatenate([[focus], neighbors])
+
+            remap = np.full(n, -1)
+            remap[keep] = np.arange(len(keep))
+            rows = (remap[src] >= 0) & (remap[dst] >= 0)
+            src, dst, amt = remap[src[rows]], remap[dst[rows]], amt[rows]
+            addrs, total_in, total_out = addrs[keep], total_in[keep], total_out[keep]
+            tx_in, tx_out = tx_in[keep], tx_out[keep]
+            n = len(keep)
+
+    # adjacency matrices; tocsr() sums duplicate (src, dst) pairs.
+    # A counts transactions so its sparsity pattern is exactly the edge set,
+    # even for pairs whose ETH total is zero, and its entries are the tx counts.
+    M = sp.coo_matrix((amt, (src, dst)), shape=(n, n)).tocsr()
+    A = sp.coo_matrix((np.ones(len(src), dtype=np.int32), (src, dst)), shape=(n, n)).tocsr()
+
+    # the graph is built directly at its final size
+    edges = A.tocoo()
+    values = np.asarray(M[edges.row, edges.col]).ravel()
+
+    G = nx.DiGraph()
+    G.add_nodes_from(
+        (addr, {"total_in": float(t_in), "total_out": float(t_out), "tx_in": int(n_in), "tx_out": int(n_out)})
+        for addr, t_in, t_out, n_in, n_out in zip(addrs, total_in, total_out, tx_in, tx_out)
+    )
+    G.add_edges_from(
+        (addrs[r], addrs[c], {"total_value": float(v), "tx_count": int(k)})
+        for r, c, v, k in zip(edges.row, edges.col, values, edges.data)
+    )
     return G
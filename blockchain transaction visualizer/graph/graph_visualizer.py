@@ -1,5 +1,8 @@
+import os
+import tempfile
+
+import numpy as np
 from pyvis.network import Network
-import math
 
 
 def pyvis_from_networkx(G, focus_node=None, physics=True):
@@ -7,33 +10,53 @@ def pyvis_from_networkx(G, focus_node=None, physics=True):
     net.force_atlas_2based()
 
     # Nodes
-    max_volume = max(
-        [(d.get("total_in", 0) + d.get("total_out", 0)) for n, d in G.nodes(data=True)], 
-        default=1
+    volumes = np.fromiter(
+        (d.get("total_in", 0) + d.get("total_out", 0) for n, d in G.nodes(data=True)),
+        dtype=np.float64, count=G.number_of_nodes()
     )
+    max_volume = volumes.max() if volumes.size else 1.0
+    sizes = (10 + 50 * (volumes / (max_volume or 1.0))).tolist()
+
+    # node names are already lowercase (normalized on load)
+    focus_lc = focus_node.lower() if focus_node else None
 
-    for n, d in G.nodes(data=True):
-        vol = d.get("total_in", 0) + d.get("total_out", 0)
-        size = 10 + (50 * (vol / max_volume))
+    labels = {n: (n[:10] + "..." if len(n) > 14 else n) for n in G.nodes()}
 
-        color = "#ffcc00" if focus_node and n.lower() == focus_node.lower() else None
+    for (n, d), size in zip(G.nodes(data=True), sizes):
+        color = "#ffcc00" if n == focus_lc else None
 
         net.add_node(
             n,
-            label=n[:10] + "..." if len(n) > 14 else n,
+            label=labels[n],
             title=f"In: {d.get('total_in',0):.6f} | Out: {d.get('total_out',0):.6f}",
             size=size,
             color=color
         )
 
     # Edges
-    for u, v, d in G.edges(data=True):
-        val = d.get("total_value", 0)
-        width = 1 + math.log1p(val + 1) * 2
+    values = np.fromiter(
+        (d.get("total_value", 0) for u, v, d in G.edges(data=True)),
+        dtype=np.float64, count=G.number_of_edges()
+    )
+    widths = (1 + np.log1p(values + 1) * 2).tolist()
 
+    for (u, v), val, width in zip(G.edges(), values.tolist(), widths):
         net.add_edge(
             u, v, width=width, title=f"{val:.4f} ETH", arrows="to"
         )
 
     net.toggle_physics(physics)
     return net
+
+
+def network_html(net):
+    """Return the pyvis page as a string, without writing to the working directory."""
+    if hasattr(net, "generate_html"):
+        return net.generate_html(notebook=False)
+
+    # older pyvis: go through a private temp file
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "network.html")
+        net.write_html(path)
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
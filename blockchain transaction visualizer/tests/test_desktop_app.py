@@ -0,0 +1,53 @@
+import os
+import threading
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("tkinter")
+pytest.importorskip("matplotlib")
+
+import desktop_app  # noqa: E402
+
+SAMPLE_CSV = os.path.join(os.path.dirname(__file__), "..", "sample", "sample_transactions.csv")
+
+
+@pytest.fixture
+def sample_df(monkeypatch):
+    raw = pd.read_csv(SAMPLE_CSV)
+    monkeypatch.setattr(desktop_app, "fetch_transactions_cached", lambda address, apikey: raw)
+    # _fetch_worker does not touch the Tk widgets, so no window is needed
+    return raw, desktop_app.App._fetch_worker(None, "0xaaa", "key")
+
+
+def test_fetch_worker_prepares_sample(sample_df):
+    raw, df = sample_df
+    assert len(df) == len(raw)
+    assert (df["from"] == raw["from"].str.lower()).all()
+    np.testing.assert_allclose(df["value_eth"].to_numpy(), raw["value"].to_numpy() / 1e18)
+
+
+def test_sample_graph_counts(sample_df):
+    raw, df = sample_df
+    G = desktop_app.build_graph_from_txlist(df)
+    assert sum(d["tx_count"] for _, _, d in G.edges(data=True)) == len(raw)
+    assert sum(d["tx_out"] for _, d in G.nodes(data=True)) == len(raw)
+    assert sum(d["tx_in"] for _, d in G.nodes(data=True)) == len(raw)
+    assert sum(d["total_value"] for _, _, d in G.edges(data=True)) == pytest.approx(raw["value"].astype(float).sum() / 1e18)
+
+    G = desktop_app.build_graph_from_txlist(df, min_value_eth=1.0)
+    assert sum(d["tx_count"] for _, _, d in G.edges(data=True)) == int((df["value_eth"] >= 1.0).sum())
+
+
+def test_layout_cache_keys_on_nodes():
+    app = desktop_app.App.__new__(desktop_app.App)
+    app._layout_cache, app._layout_lock = {}, threading.Lock()
+    # same edges and node count, but a different isolated node
+    a, b = nx.DiGraph([("x", "y")]), nx.DiGraph([("x", "y")])
+    a.add_node("p")
+    b.add_node("q")
+    for G in (a, b):
+        _, pos = app.compute_layout(G)
+        assert set(pos) == set(G.nodes())
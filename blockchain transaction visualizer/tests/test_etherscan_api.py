@@ -0,0 +1,50 @@
+import httpx
+import pytest
+
+from api import etherscan_api
+
+
+def _fake_etherscan(txs):
+    """Mimic txlist paging: rows from startblock on, page/offset slices, and the page * offset cap."""
+    def handler(request):
+        params = request.url.params
+        page, offset = int(params["page"]), int(params["offset"])
+        if page * offset > etherscan_api.MAX_WINDOW:
+            return httpx.Response(200, json={"status": "0", "message": "NOTOK", "result": "Result window is too large"})
+        rows = [t for t in txs if int(t["blockNumber"]) >= int(params["startblock"])]
+        rows = rows[(page - 1) * offset: page * offset]
+        if not rows:
+            return httpx.Response(200, json={"status": "0", "message": "No transactions found", "result": []})
+        return httpx.Response(200, json={"status": "1", "message": "OK", "result": rows})
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def small_window(monkeypatch):
+    monkeypatch.setattr(etherscan_api, "PAGE_SIZE", 10)
+    monkeypatch.setattr(etherscan_api, "MAX_WINDOW", 30)
+
+
+def _txs(n, per_block):
+    return [{"hash": f"0x{i:x}", "blockNumber": str(i // per_block), "value": "1"} for i in range(n)]
+
+
+@pytest.mark.parametrize("n, per_block", [(95, 3), (95, 7), (30, 4), (61, 1)])
+def test_cursor_restart_keeps_every_transaction(monkeypatch, small_window, n, per_block):
+    txs = _txs(n, per_block)
+    monkeypatch.setattr(etherscan_api, "_CLIENT", _fake_etherscan(txs))
+
+    out = list(etherscan_api.fetch_transactions_from_etherscan("0xabc", "key"))
+
+    assert [t["hash"] for t in out] == [t["hash"] for t in txs]
+
+
+def test_api_error_is_raised(monkeypatch):
+    def handler(request):
+        return httpx.Response(200, json={"status": "0", "message": "NOTOK", "result": "Invalid API Key"})
+
+    monkeypatch.setattr(etherscan_api, "_CLIENT", httpx.Client(transport=httpx.MockTransport(handler)))
+
+    with pytest.raises(Exception, match="Invalid API Key"):
+        list(etherscan_api.fetch_transactions_from_etherscan("0xabc", "key"))
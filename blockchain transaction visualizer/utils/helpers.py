@@ -1,5 +1,60 @@
+import os
+import re
+import time
+
+import pandas as pd
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "btv")
+CACHE_TTL = 300
+_ADDRESS_RE = re.compile(r"^0x[0-9a-fA-F]{40}$")
+
+
 def wei_to_eth(value):
     try:
         return int(value) / 1e18
     except:
         return 0.0
+
+
+def wei_to_eth_array(values):
+    """Vectorized wei_to_eth for a whole column; unparsable values become 0.0."""
+    return pd.to_numeric(values, errors="coerce").astype("float64").fillna(0.0).to_numpy() / 1e18
+
+
+def normalize_addresses(df):
+    """Lowercase the address columns in place, once, so checksum casing never breaks a lookup."""
+    for c in ("from", "to"):
+        if c in df.columns:
+            df[c] = df[c].astype("string").str.lower()
+    return df
+
+
+def _cache_path(address):
+    if not address or not _ADDRESS_RE.match(address):
+        return None
+    return os.path.join(CACHE_DIR, f"{address.lower()}.parquet")
+
+
+def load_cached_txs(address, ttl=CACHE_TTL):
+    """Return the on-disk transaction frame for `address` if it is fresher than `ttl` seconds."""
+    path = _cache_path(address)
+    if path is None or not os.path.exists(path):
+        return None
+    if time.time() - os.path.getmtime(path) > ttl:
+        return None
+    try:
+        return pd.read_parquet(path)
+    except Exception:
+        return None
+
+
+def save_cached_txs(address, df):
+    path = _cache_path(address)
+    if path is None or df.empty:
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        df.to_parquet(path, index=False)
+    except Exception:
+        # pyarrow missing or cache dir not writable: just skip the disk cache
+        pass